@@ -1,20 +1,31 @@
+import os
 from setuptools import find_packages, setup
 from typing import List
 
+# Compiling src/exception.py with mypyc is opt-in: set MLPROJECT_MYPYC=1 (see README.md).
+ext_modules = []
+if os.environ.get("MLPROJECT_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError as e:
+        raise RuntimeError(
+            "MLPROJECT_MYPYC=1 needs mypy in the build environment: "
+            "pip install mypy && pip install --no-build-isolation ."
+        ) from e
+    ext_modules = mypycify(["src/exception.py"])
+
 HYPHEN_E_DOT = "-e ."
 def get_requirements(file_path: str) -> List[str]:
     '''
     This function returns the LIST of requirements
     '''
-    requirements = []
     with open(file_path) as file_obj:
-        requirements = file_obj.readlines() # read the file and return a list of requirements
-        requirements = [req.replace("\n", "") for req in requirements]
-
-        if HYPHEN_E_DOT in requirements:
-            requirements.remove(HYPHEN_E_DOT) # removed so that it is not considered as a package
-    
-    return requirements
+        # splitlines() drops the newlines; "-e ." is skipped so that it is not considered as a package,
+        # and blank or commented-out lines are not requirements either
+        return [
+            req for req in file_obj.read().splitlines()
+            if req and req != HYPHEN_E_DOT and not req.startswith("#")
+        ]
 
 setup(
     name = "mlproject",
@@ -22,6 +33,7 @@ setup(
     author = "Hung",
     author_email = "hungtv11224567@gmail.com",
     packages = find_packages(),
-    install_requires = get_requirements('requirements.txt')
+    install_requires = get_requirements('requirements.txt'),
+    ext_modules = ext_modules,
 
 )
\ No newline at end of file
@@ -8,31 +8,74 @@ encoding, and scaling strategies.
 
 import sys
 import os
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 import numpy as np
-import pandas as pd
-from pandas.core.arrays import categorical
 
-# sklearn imports for data preprocessing
-from sklearn.compose import ColumnTransformer  # For applying different transformers to different columns
-from sklearn.impute import SimpleImputer  # For handling missing values
-from sklearn.pipeline import Pipeline  # For chaining multiple preprocessing steps
-from sklearn.preprocessing import OneHotEncoder, StandardScaler  # For encoding categorical features and scaling
+# pandas, scipy, sklearn and the pipeline modules are imported inside the methods that use them,
+# so importing this module (e.g. only for DataTransformationConfig) stays cheap.
 
 # Custom imports for error handling and logging
 from src.exception import CustomException
 from src.logger import logging
 from src.utils import save_object
 
+# Column layout of the student CSVs
+TARGET_COLUMN = "math_score"
+NUMERICAL_COLUMNS = ["writing_score", "reading_score"]
+CATEGORICAL_COLUMNS = [
+    "gender",
+    "race_ethnicity",
+    "parental_level_of_education",
+    "lunch",
+    "test_preparation_course",
+]
+
+# Explicit column dtypes for the student CSVs.
+# Passing these to the pyarrow parser skips pandas' type-inference pass; categoricals are
+# dictionary-encoded and scores are stored as float32 instead of float64/object.
+CSV_DTYPES = {
+    "gender": "category",
+    "race_ethnicity": "category",
+    "parental_level_of_education": "category",
+    "lunch": "category",
+    "test_preparation_course": "category",
+    "writing_score": "float32",
+    "reading_score": "float32",
+    "math_score": "float32",
+}
+
+# Cells read as missing values, the same list as pandas.read_csv's default na_values
+# (pyarrow's own default would keep blank categorical cells as "" instead of null)
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Number of CSV rows read at a time by the out-of-core transformation
+CHUNK_SIZE = 200_000
+
 # @dataclass decorator automatically generates __init__, __repr__, and other special methods
 # This makes the configuration class cleaner and easier to use
-@dataclass
+# frozen=True makes the settings read-only; slots=True drops the per-instance __dict__
+@dataclass(frozen=True, slots=True)
 class DataTransformationConfig:
     """
     Configuration class for data transformation.
-    Stores the file path where the preprocessor object will be saved.
+    Stores the file paths where the preprocessor objects and the out-of-core arrays will be saved.
+    The streaming preprocessor gets its own file since its feature layout differs from the in-memory one.
     """
-    preprocessor_obj_file_path = os.path.join('artifacts',"preprocessor.pkl")
+    preprocessor_obj_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"preprocessor.pkl"))
+    streaming_preprocessor_obj_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"streaming_preprocessor.pkl"))
+    train_arr_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"train_arr.dat"))
+    test_arr_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"test_arr.dat"))
+    # Streaming output only: store the scaled numerical columns as int16 (value * scale) in their own files,
+    # half the bytes of float32. Divide by num_quantization_scale to get the standardized values back.
+    quantize_num_features: bool = False
+    num_quantization_scale: int = 10000
+    train_num_arr_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"train_num_arr.dat"))
+    test_num_arr_file_path: str = field(default_factory=lambda: os.path.join('artifacts',"test_num_arr.dat"))
 
 class DataTransformation:
     """
@@ -42,19 +85,29 @@ class DataTransformation:
     which are then combined using ColumnTransformer to handle different data types appropriately.
     """
     
-    def __init__(self):
+    def __init__(self, data_transformation_config=None):
         """
         Initialize the DataTransformation class with configuration settings.
+
+        Args:
+            data_transformation_config (DataTransformationConfig, optional): Settings to use instead
+                of the defaults; the config is frozen, so custom values are passed in here
         """
-        self.data_transformation_config = DataTransformationConfig()
+        self.data_transformation_config = data_transformation_config or DataTransformationConfig()
+        # Dense output buffers reused across calls, keyed by name ("train", "test", ...)
+        self._out_buffers = {}
 
-    def get_data_transformer_object(self):
+    def get_data_transformer_object(self, feature_columns):
         """
         Creates and returns a data transformer object with preprocessing pipelines.
         
         This method defines:
         1. Numerical columns pipeline: handles missing values with median imputation and standard scaling
-        2. Categorical columns pipeline: handles missing values with mode imputation, one-hot encoding, and scaling
+        2. Categorical columns pipeline: handles missing values with mode imputation, feature hashing, and scaling
+        
+        Args:
+            feature_columns (pd.Index): Columns of the input feature dataframe, used to resolve
+                the numerical and categorical columns to positional indices once
         
         Returns:
             ColumnTransformer: A transformer object that applies different pipelines to different column types
@@ -70,36 +123,33 @@ class DataTransformation:
         - Preserves the original distribution of categories
         """
         try:
+            # sklearn imports for data preprocessing
+            from sklearn.compose import ColumnTransformer  # For applying different transformers to different columns
+            from sklearn.impute import SimpleImputer  # For handling missing values
+            from sklearn.pipeline import Pipeline  # For chaining multiple preprocessing steps
+            from sklearn.preprocessing import StandardScaler  # For scaling
+
+            # Numba-compiled imputation + scaling for the numerical features
+            from src.components.fast_num_pipeline import FastNumericalTransformer
+            # Feature hashing for the categorical features
+            from src.components.hashing_encoder import CategoricalHasher
+
             # Define numerical columns (continuous/discrete numeric features)
-            numerical_columns = ["writing_score", "reading_score"]
+            numerical_columns = NUMERICAL_COLUMNS
             
             # Define categorical columns (nominal/ordinal features)
-            categorical_columns = [
-                "gender",
-                "race_ethnicity",
-                "parental_level_of_education",
-                "lunch",
-                "test_preparation_course",
-            ]
+            categorical_columns = CATEGORICAL_COLUMNS
 
             # Pipeline for numerical features
-            # Steps are applied sequentially: imputation -> scaling
-            num_pipeline = Pipeline(
-                steps = [
-                    # Step 1: Impute missing values using median strategy
-                    # Median is chosen because it's robust to outliers and works well for skewed distributions
-                    ("imputer", SimpleImputer(strategy="median")),
-                    
-                    # Step 2: Standardize features (mean=0, std=1)
-                    # This ensures all numerical features are on the same scale for better model performance
-                    ("scaler", StandardScaler())
-                ]
-            )
+            # Both steps run in one Numba-compiled kernel: imputation -> scaling
+            # 1: Impute missing values using the median, which is robust to outliers and skewed distributions
+            # 2: Standardize features (mean=0, std=1) so all numerical features are on the same scale
+            num_pipeline = FastNumericalTransformer()
 
-            logging.info(f"Numerical columns: {numerical_columns}")
+            logging.info("Numerical columns: %s", numerical_columns)
 
             # Pipeline for categorical features
-            # Steps are applied sequentially: imputation -> encoding -> scaling
+            # Steps are applied sequentially: imputation -> hashing -> scaling
             cat_pipeline = Pipeline(
                 steps = [
                     # Step 1: Impute missing values using most_frequent (mode) strategy
@@ -107,25 +157,34 @@ class DataTransformation:
                     # It replaces missing values with the most frequently occurring category
                     ("imputer", SimpleImputer(strategy="most_frequent")),
                     
-                    # Step 2: One-hot encode categorical features
-                    # Converts categorical variables into binary (0/1) columns
-                    # Each category becomes a separate binary feature
-                    ("one_hot_encoder", OneHotEncoder()),
+                    # Step 2: Hash-encode categorical features
+                    # Each "column=value" token is hashed into a fixed number of sparse float64 columns,
+                    # so no category vocabulary is stored and unseen test categories need no special case
+                    ("hashing_encoder", CategoricalHasher()),
                     
                     # Step 3: Standardize the encoded features
-                    # Even after one-hot encoding, scaling helps with model convergence and performance
-                    # with_mean must be False because one-hot output is sparse; centering would densify.
-                    ("scaler", StandardScaler(with_mean=False))
+                    # Even after encoding, scaling helps with model convergence and performance
+                    # with_mean must be False because the hashed output is sparse; centering would densify.
+                    # The hasher already emits float64, so copy=False scales its freshly allocated output in place
+                    # instead of converting it into a new matrix.
+                    ("scaler", StandardScaler(with_mean=False, copy=False))
                 ]
             )
             
-            logging.info(f"Categorical columns: {categorical_columns}")
+            logging.info("Categorical columns: %s", categorical_columns)
             
+            # Resolve column names to positions once so transform() does not repeat the name lookup
+            num_idx = [feature_columns.get_loc(col) for col in numerical_columns]
+            cat_idx = [feature_columns.get_loc(col) for col in categorical_columns]
+
             preprocessor = ColumnTransformer(
                 [
-                    ("num_pipeline", num_pipeline, numerical_columns),
-                    ("cat_pipeline", cat_pipeline, categorical_columns)
-                ]
+                    ("num_pipeline", num_pipeline, num_idx),
+                    ("cat_pipeline", cat_pipeline, cat_idx)
+                ],
+                n_jobs=-1,  # run the numerical and categorical pipelines in parallel
+                sparse_threshold=1.0,  # always keep the stacked output sparse
+                verbose_feature_names_out=False,
             )
 
             return preprocessor
@@ -133,49 +192,219 @@ class DataTransformation:
         except Exception as e:
             raise CustomException(e, sys)
 
+    def _append_target(self, input_feature_arr, target_feature, buffer_key):
+        """
+        Returns the transformed features with the target appended as the last column.
+
+        Sparse features stay sparse (CSR). Dense features are written into a float32 buffer
+        that is allocated once per buffer_key and reused while the shape stays the same,
+        so the array returned by a previous call with the same key is overwritten.
+        """
+        import scipy.sparse
+
+        # float32 target column (Series or array), avoiding the extra copy np.array() would make
+        target = np.asarray(target_feature, dtype=np.float32)
+
+        if scipy.sparse.issparse(input_feature_arr):
+            return scipy.sparse.hstack([input_feature_arr, target.reshape(-1, 1)], format="csr", dtype=np.float32)
+
+        n_rows, n_cols = input_feature_arr.shape
+        out = self._out_buffers.get(buffer_key)
+        if out is None or out.shape != (n_rows, n_cols + 1):
+            out = np.empty((n_rows, n_cols + 1), dtype=np.float32)
+            self._out_buffers[buffer_key] = out
+
+        out[:, :n_cols] = input_feature_arr
+        out[:, -1] = target
+        return out
+
+    @staticmethod
+    def _read_csv_table(path):
+        """
+        Reads a CSV into a pyarrow Table with the column types from CSV_DTYPES.
+
+        pyarrow parses the file with multiple threads; categoricals become dictionary-encoded
+        strings and scores float32. Missing cells (CSV_NA_VALUES) are null in every column,
+        matching pd.read_csv, so the imputers see them as missing.
+        """
+        import pyarrow as pa
+        import pyarrow.csv
+
+        arrow_types = {"category": pa.dictionary(pa.int32(), pa.string()), "float32": pa.float32()}
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={col: arrow_types[dtype] for col, dtype in CSV_DTYPES.items()},
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+        )
+        return pyarrow.csv.read_csv(path, convert_options=convert_options)
+
     def initiate_data_transformation(self, train_path, test_path):
+        """
+        Fits the preprocessor on the train CSV, transforms the train and test CSVs and saves
+        the fitted preprocessor.
+
+        The returned arrays have the target as the last column. They are sparse CSR matrices
+        when the preprocessor output is sparse (the default). Dense outputs are written into
+        buffers owned by this DataTransformation instance: calling this method again on the same
+        instance overwrites the train_arr / test_arr returned earlier. Copy them, or use a new
+        instance per call (e.g. per CV fold), if you need to keep them.
+
+        Returns:
+            tuple: (train_arr, test_arr, preprocessor object file path)
+        """
         try:
-            train_df = pd.read_csv(train_path)
-            test_df = pd.read_csv(test_path)
+            train_table = self._read_csv_table(train_path)
+            test_table = self._read_csv_table(test_path)
 
             logging.info("Read train and test data completed")
             
-            logging.info("Obtaining preprocessing object")
+            target_column_name = TARGET_COLUMN
 
-            preprocessing_obj = self.get_data_transformer_object()
+            # Arrow column selection shares the buffers instead of copying the table like DataFrame.drop.
+            # The features convert to pandas Categorical (dictionary codes) and float32 columns with NaN for
+            # nulls, which SimpleImputer treats as missing (it can't handle pd.NA in ArrowDtype columns).
+            # The target goes straight to NumPy (zero-copy for a single chunk without nulls).
+            input_feature_train_df = train_table.drop_columns([target_column_name]).to_pandas()
+            target_feature_train_arr = train_table.column(target_column_name).to_numpy()
 
-            target_column_name = "math_score"
-            numerical_columns = ["writing_score", "reading_score"]\
+            input_feature_test_df = test_table.drop_columns([target_column_name]).to_pandas()
+            target_feature_test_arr = test_table.column(target_column_name).to_numpy()
 
-            input_feature_train_df = train_df.drop(columns=[target_column_name],axis=1)
-            target_feature_train_df=train_df[target_column_name]
+            logging.info("Obtaining preprocessing object")
 
-            input_feature_test_df=test_df.drop(columns=[target_column_name],axis=1)
-            target_feature_test_df=test_df[target_column_name]
+            preprocessing_obj = self.get_data_transformer_object(input_feature_train_df.columns)
 
             logging.info(
-                f"Applying preprocessing object on training dataframe and testing dataframe."
+                "Applying preprocessing object on training dataframe and testing dataframe."
             )
 
             input_feature_train_arr = preprocessing_obj.fit_transform(input_feature_train_df)
-            input_feature_test_arr = preprocessing_obj.transform(input_feature_test_df)
 
-            train_arr = np.c_[
-                input_feature_train_arr, np.array(target_feature_train_df)
-            ]
-            test_arr = np.c_[input_feature_test_arr, np.array(target_feature_test_df)]
+            # Transform the test set on a worker thread (the numpy/scipy paths release the GIL)
+            # while the main thread builds the train array and saves the fitted preprocessor.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                test_future = executor.submit(preprocessing_obj.transform, input_feature_test_df)
+
+                # Append the target as the last column without densifying the sparse encoded features
+                train_arr = self._append_target(input_feature_train_arr, target_feature_train_arr, "train")
+
+                save_object(
+                    file_path = self.data_transformation_config.preprocessor_obj_file_path,
+                    obj = preprocessing_obj
+                )
+
+                logging.info("Saved preprocessing object.")
+
+                input_feature_test_arr = test_future.result()
 
-            logging.info(f"Saved preprocessing object.")
+            test_arr = self._append_target(input_feature_test_arr, target_feature_test_arr, "test")
+
+            return (
+                train_arr,
+                test_arr,
+                self.data_transformation_config.preprocessor_obj_file_path,
+            )
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def _stream_transform(self, preprocessor, csv_path, arr_file_path, chunksize, num_arr_file_path=None):
+        """
+        Transforms the CSV chunk by chunk and appends each chunk (features + target column)
+        to a raw float32 file, returned as a read-only memmap (or an empty array when the
+        CSV has no rows, since an empty file cannot be memory-mapped).
+
+        With num_arr_file_path, the numerical columns are quantized to int16 and written to that
+        file instead; the float32 file then holds only the categorical columns and the target,
+        and a (num_arr, arr) pair is returned.
+        """
+        import pandas as pd
+
+        from src.components.fast_num_pipeline import quantize_int16
+
+        n_num = len(preprocessor.numerical_columns) if num_arr_file_path else 0
+        scale = self.data_transformation_config.num_quantization_scale
+
+        n_rows = 0
+        with open(arr_file_path, "wb") as arr_file, \
+                (open(num_arr_file_path, "wb") if num_arr_file_path else nullcontext()) as num_arr_file:
+            for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=CSV_DTYPES):
+                features = preprocessor.transform(chunk)
+                if num_arr_file is not None:
+                    quantize_int16(features[:, :n_num], scale).tofile(num_arr_file)
+                # Every chunk reuses the same buffer, it is written to disk before the next one
+                arr = self._append_target(features[:, n_num:], chunk[TARGET_COLUMN], "stream")
+                arr.tofile(arr_file)
+                n_rows += len(chunk)
+
+        arr = self._open_memmap(arr_file_path, np.float32, (n_rows, preprocessor.n_features_out_ - n_num + 1))
+        if num_arr_file_path is None:
+            return arr
+        return self._open_memmap(num_arr_file_path, np.int16, (n_rows, n_num)), arr
+
+    @staticmethod
+    def _open_memmap(file_path, dtype, shape):
+        """
+        Opens a raw array file as a read-only memmap, or returns an empty array for zero rows.
+        """
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(file_path, dtype=dtype, mode="r", shape=shape)
+
+    def initiate_streaming_data_transformation(self, train_path, test_path, chunksize=CHUNK_SIZE):
+        """
+        Out-of-core version of initiate_data_transformation for CSVs larger than memory.
+
+        Pass 1 fits a StreamingPreprocessor on the train CSV chunk by chunk; pass 2 transforms the
+        train and test CSVs chunk by chunk into memmapped float32 arrays on disk (target last).
+
+        The categoricals are one-hot encoded with one dense column per training category rather than
+        hashed, so the columns differ from initiate_data_transformation's and the preprocessor is saved
+        to streaming_preprocessor_obj_file_path.
+
+        With quantize_num_features set in the config, the numerical columns are stored as int16 in
+        train_num_arr_file_path / test_num_arr_file_path, and train_arr / test_arr are each a
+        (num_arr int16 memmap, float32 memmap of the categorical columns + target) pair.
+
+        Returns:
+            tuple: (train_arr memmap, test_arr memmap, streaming preprocessor object file path)
+        """
+        try:
+            import pandas as pd
+
+            # Chunk-wise preprocessing for CSVs that do not fit in memory
+            from src.components.streaming_pipeline import StreamingPreprocessor
+
+            logging.info("Fitting streaming preprocessor on training data")
+
+            preprocessing_obj = StreamingPreprocessor(NUMERICAL_COLUMNS, CATEGORICAL_COLUMNS)
+            for chunk in pd.read_csv(train_path, chunksize=chunksize, dtype=CSV_DTYPES):
+                preprocessing_obj.partial_fit(chunk)
+            preprocessing_obj.finalize()
+
+            logging.info("Applying streaming preprocessor on training and testing data")
+
+            os.makedirs(os.path.dirname(self.data_transformation_config.train_arr_file_path), exist_ok=True)
+            quantize = self.data_transformation_config.quantize_num_features
+            train_arr = self._stream_transform(
+                preprocessing_obj, train_path, self.data_transformation_config.train_arr_file_path, chunksize,
+                self.data_transformation_config.train_num_arr_file_path if quantize else None,
+            )
+            test_arr = self._stream_transform(
+                preprocessing_obj, test_path, self.data_transformation_config.test_arr_file_path, chunksize,
+                self.data_transformation_config.test_num_arr_file_path if quantize else None,
+            )
+
+            logging.info("Saved preprocessing object.")
 
             save_object(
-                file_path = self.data_transformation_config.preprocessor_obj_file_path,
+                file_path = self.data_transformation_config.streaming_preprocessor_obj_file_path,
                 obj = preprocessing_obj
             )
 
             return (
                 train_arr,
                 test_arr,
-                self.data_transformation_config.preprocessor_obj_file_path,
+                self.data_transformation_config.streaming_preprocessor_obj_file_path,
             )
         except Exception as e:
-            raise CustomException(e, sys)
\ No newline at end of file
+            raise CustomException(e, sys)
@@ -0,0 +1,145 @@
+"""
+Fast Numerical Pipeline Module
+
+This module provides a Numba-compiled replacement for the
+SimpleImputer(strategy="median") -> StandardScaler() pipeline used on the numerical features.
+Imputation and standardization are fused into a single compiled kernel, so the data is not
+copied between transformers and no Python dispatch happens per step.
+"""
+
+import numpy as np
+from numba import njit, prange
+from sklearn.base import BaseEstimator, OneToOneFeatureMixin, TransformerMixin
+
+# Every fast-math flag except "nnan": the kernels rely on np.isnan to find the missing values,
+# which LLVM is allowed to fold away when it may assume there are no NaNs.
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def fit_transform_num(X, medians_out, means_out, stds_out):
+    """
+    Learns the per-column median, mean and std of X and returns the imputed, standardized copy.
+
+    Args:
+        X (np.ndarray): 2D float64 array, NaN marks a missing value
+        medians_out, means_out, stds_out (np.ndarray): 1D float64 arrays of length n_cols,
+            filled with the fitted statistics
+
+    Returns:
+        np.ndarray: Array of the same shape as X with mean 0 and std 1 per column
+    """
+    n_rows, n_cols = X.shape
+    out = np.empty((n_rows, n_cols), dtype=np.float64)
+
+    # Columns are independent, so each one is processed by its own thread
+    for j in prange(n_cols):
+        median = np.nanmedian(X[:, j])
+
+        # Pass 1: impute missing values with the median and accumulate the sum
+        total = 0.0
+        for i in range(n_rows):
+            value = X[i, j]
+            if np.isnan(value):
+                value = median
+            out[i, j] = value
+            total += value
+        mean = total / n_rows
+
+        # Pass 2: population variance, matching StandardScaler (ddof=0)
+        sq_total = 0.0
+        for i in range(n_rows):
+            diff = out[i, j] - mean
+            sq_total += diff * diff
+        std = np.sqrt(sq_total / n_rows)
+        if std == 0.0:
+            std = 1.0  # constant column, same behaviour as StandardScaler
+
+        # Pass 3: standardize in place
+        for i in range(n_rows):
+            out[i, j] = (out[i, j] - mean) / std
+
+        medians_out[j] = median
+        means_out[j] = mean
+        stds_out[j] = std
+
+    return out
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def transform_num(X, medians, means, stds):
+    """
+    Imputes and standardizes X with statistics learned by fit_transform_num.
+    """
+    n_rows, n_cols = X.shape
+    out = np.empty((n_rows, n_cols), dtype=np.float64)
+
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            value = X[i, j]
+            if np.isnan(value):
+                value = medians[j]
+            out[i, j] = (value - means[j]) / stds[j]
+
+    return out
+
+
+def quantize_int16(X, scale):
+    """
+    Quantizes standardized values to int16 (value * scale, rounded), saturating at the int16 range.
+
+    With scale=10000 the representable range is about [-3.28, 3.28] standard deviations.
+    """
+    info = np.iinfo(np.int16)
+    return np.clip(np.round(np.asarray(X) * scale), info.min, info.max).astype(np.int16)
+
+
+def _to_float_array(X):
+    """
+    Converts a dataframe (including pyarrow-backed ones with pd.NA) or array-like to a
+    C-contiguous float64 array with NaN for missing values.
+    """
+    if hasattr(X, "to_numpy"):
+        X = X.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.ascontiguousarray(X, dtype=np.float64)
+
+
+class FastNumericalTransformer(OneToOneFeatureMixin, TransformerMixin, BaseEstimator):
+    """
+    Median imputation followed by standard scaling, computed in one compiled pass.
+
+    Attributes (set by fit):
+        medians_ (np.ndarray): Per-column median used to fill missing values
+        means_ (np.ndarray): Per-column mean of the imputed data
+        stds_ (np.ndarray): Per-column population std of the imputed data (1.0 for constant columns)
+    """
+
+    def fit(self, X, y=None):
+        self.fit_transform(X)
+        return self
+
+    def fit_transform(self, X, y=None):
+        # Overridden so fitting and transforming the training data share a single kernel call
+        if hasattr(X, "columns"):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        X = _to_float_array(X)
+        if X.shape[0] == 0:
+            raise ValueError("FastNumericalTransformer needs at least one row to fit")
+        self.n_features_in_ = X.shape[1]
+
+        self.medians_ = np.empty(self.n_features_in_, dtype=np.float64)
+        self.means_ = np.empty(self.n_features_in_, dtype=np.float64)
+        self.stds_ = np.empty(self.n_features_in_, dtype=np.float64)
+
+        out = fit_transform_num(X, self.medians_, self.means_, self.stds_)
+
+        # A column with no observed values has no median; the kernel would spread NaN through it
+        missing = np.flatnonzero(np.isnan(self.medians_))
+        if missing.size:
+            names = self.feature_names_in_[missing] if hasattr(self, "feature_names_in_") else missing
+            raise ValueError(f"Cannot impute columns with no observed values: {list(names)}")
+
+        return out
+
+    def transform(self, X):
+        return transform_num(_to_float_array(X), self.medians_, self.means_, self.stds_)
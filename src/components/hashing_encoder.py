@@ -0,0 +1,52 @@
+"""
+Hashing Encoder Module
+
+This module provides a feature-hashing ("hashing trick") encoder for the categorical features.
+Each value is hashed into one of a fixed number of columns, so the output width does not depend
+on the number of categories and no category vocabulary has to be learned or stored.
+"""
+
+import numpy as np
+import scipy.sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.feature_extraction import FeatureHasher
+
+
+class CategoricalHasher(TransformerMixin, BaseEstimator):
+    """
+    Hashes every "<column>=<value>" token of a row into a sparse float64 0/1 matrix.
+
+    The column position is part of the token, so equal values in different columns
+    (e.g. "none") land in different buckets. Unseen test categories are simply hashed too.
+
+    As with any hashing trick, two categories can share a column; the output width stays fixed
+    whatever the number of categories, and a larger n_features makes collisions rarer
+    (with k categories, about k * k / (2 * n_features) colliding pairs are expected).
+
+    Args:
+        n_features (int): Number of output columns. The output is sparse, so a wide default
+            costs little memory.
+    """
+
+    def __init__(self, n_features=2**10):
+        self.n_features = n_features
+
+    def _hasher(self):
+        # alternate_sign=False keeps the indicators at 0/1 instead of ±1
+        return FeatureHasher(n_features=self.n_features, input_type="string", dtype=np.float64, alternate_sign=False)
+
+    @staticmethod
+    def _tokens(X):
+        return ([f"{j}={value}" for j, value in enumerate(row)] for row in X)
+
+    def fit(self, X, y=None):
+        # Nothing to learn: hashing needs no vocabulary
+        self.n_features_in_ = np.shape(X)[1]
+        return self
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=object)
+        if len(X) == 0:
+            # FeatureHasher can't take an empty iterable of rows
+            return scipy.sparse.csr_matrix((0, self.n_features), dtype=np.float64)
+        return self._hasher().transform(self._tokens(X))
@@ -0,0 +1,145 @@
+"""
+Streaming Pipeline Module
+
+This module provides an out-of-core version of the preprocessing done in data_transformation.py,
+for CSV files that do not fit in memory.
+
+The statistics each transformer needs are accumulated one chunk at a time:
+- median of the numerical columns: t-digest sketch
+- mean / std of the numerical columns: Welford's running mean and variance
+- categories (and their counts, for the mode and the one-hot scaling): one pass over each chunk
+
+so peak memory is O(chunk size) instead of O(file size).
+
+Unlike the in-memory preprocessor, which hashes the categoricals into a wide sparse matrix, the
+output here is dense, so each category keeps its own exact one-hot column: numerical columns first,
+then one column per training category. The two preprocessors are therefore not interchangeable.
+"""
+
+import numpy as np
+import pandas as pd
+from tdigest import TDigest
+
+
+class StreamingPreprocessor:
+    """
+    Chunk-wise equivalent of the numerical and categorical pipelines.
+
+    Numerical columns: median imputation -> standard scaling.
+    Categorical columns: mode imputation -> one-hot encoding -> scaling without centering.
+
+    Usage: call partial_fit() on every chunk, then finalize(), then transform() chunk by chunk.
+    """
+
+    def __init__(self, numerical_columns, categorical_columns):
+        self.numerical_columns = list(numerical_columns)
+        self.categorical_columns = list(categorical_columns)
+
+        n_num = len(self.numerical_columns)
+        self._digests = [TDigest() for _ in range(n_num)]
+        self._count = np.zeros(n_num, dtype=np.int64)  # non-missing values seen per column
+        self._mean = np.zeros(n_num, dtype=np.float64)
+        self._m2 = np.zeros(n_num, dtype=np.float64)  # sum of squared deviations from the mean
+        self._n_rows = 0
+        self._category_counts = {col: {} for col in self.categorical_columns}
+
+    def partial_fit(self, chunk):
+        """
+        Updates the running statistics with one chunk (a DataFrame).
+        """
+        self._n_rows += len(chunk)
+
+        for j, col in enumerate(self.numerical_columns):
+            values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                continue
+
+            self._digests[j].batch_update(values)
+
+            # Chan et al. merge of the chunk's (count, mean, M2) into the running Welford state
+            n_b = values.size
+            mean_b = values.mean()
+            m2_b = ((values - mean_b) ** 2).sum()
+            n_a = self._count[j]
+            n = n_a + n_b
+            delta = mean_b - self._mean[j]
+            self._mean[j] += delta * n_b / n
+            self._m2[j] += m2_b + delta * delta * n_a * n_b / n
+            self._count[j] = n
+
+        for col in self.categorical_columns:
+            counts = self._category_counts[col]
+            for category, count in chunk[col].value_counts(dropna=True).items():
+                counts[category] = counts.get(category, 0) + int(count)
+
+        return self
+
+    def finalize(self):
+        """
+        Turns the running statistics into the fitted parameters used by transform().
+        """
+        n = self._n_rows
+
+        # Numerical columns.
+        # The imputed medians are part of the data StandardScaler would see, so they are merged into
+        # the running stats as a group of n_missing identical values (zero variance).
+        self.medians_ = np.array([digest.percentile(50) if digest.n else 0.0 for digest in self._digests])
+        n_missing = n - self._count
+        delta = self.medians_ - self._mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.means_ = np.where(n > 0, self._mean + delta * n_missing / n, 0.0)
+            m2 = self._m2 + delta * delta * self._count * n_missing / n
+            stds = np.sqrt(m2 / n)
+        self.stds_ = np.where((stds > 0) & np.isfinite(stds), stds, 1.0)
+
+        # Categorical columns.
+        # Categories are sorted like OneHotEncoder; the mode fills missing values, so its count grows
+        # by the number of missing rows before computing the indicator std sqrt(p * (1 - p)).
+        self.categories_ = []
+        self.modes_ = []
+        self.category_scales_ = []
+        for col in self.categorical_columns:
+            counts = dict(self._category_counts[col])
+            categories = sorted(counts)
+            mode = max(categories, key=lambda category: counts[category]) if categories else None
+            if mode is not None:
+                counts[mode] += n - sum(counts.values())
+            p = np.array([counts[category] / n for category in categories], dtype=np.float64)
+            std = np.sqrt(p * (1 - p))
+            std[std == 0] = 1.0  # constant indicator column, same behaviour as StandardScaler
+
+            self.categories_.append(categories)
+            self.modes_.append(mode)
+            self.category_scales_.append(1 / std)
+
+        self.n_features_out_ = len(self.numerical_columns) + sum(len(c) for c in self.categories_)
+
+        # The sketches are only needed while fitting; dropping them keeps the artifact small and picklable
+        self._digests = None
+        self._category_counts = None
+        return self
+
+    def transform(self, chunk):
+        """
+        Transforms one chunk into a dense float32 array of shape (len(chunk), n_features_out_).
+        """
+        out = np.zeros((len(chunk), self.n_features_out_), dtype=np.float32)
+
+        for j, col in enumerate(self.numerical_columns):
+            values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = np.where(np.isnan(values), self.medians_[j], values)
+            out[:, j] = (values - self.means_[j]) / self.stds_[j]
+
+        offset = len(self.numerical_columns)
+        for col, categories, mode, scales in zip(
+            self.categorical_columns, self.categories_, self.modes_, self.category_scales_
+        ):
+            values = chunk[col].astype(object).where(chunk[col].notna(), mode)
+            # Unknown categories get code -1 and stay all zeros, like handle_unknown="ignore"
+            codes = pd.Categorical(values, categories=categories).codes
+            rows = np.flatnonzero(codes >= 0)
+            out[rows, offset + codes[rows]] = scales[codes[rows]]
+            offset += len(categories)
+
+        return out
@@ -1,23 +1,35 @@
 import sys
 import logging
+import types
+from typing import Optional
 import src.logger  # This imports the logger module, which sets up logging configuration
 
-def error_message_detail(error, error_detail):
-    _,_,exc_tb = error_detail.exc_info() # gives out which file the exception has occured, on which line number
+def _format_error_message(error: object, exc_tb: Optional[types.TracebackType]) -> str:
+    if exc_tb is None: # raised outside an except block, so there is no traceback to point at
+        return f"Error occured in Python script error message [{error}]"
     file_name = exc_tb.tb_frame.f_code.co_filename
-    error_message = "Error occured in Python script name [{0}] line number [{1}] error message [{2}]".format(
-        file_name, exc_tb.tb_lineno, str(error)
-    )
+    return f"Error occured in Python script name [{file_name}] line number [{exc_tb.tb_lineno}] error message [{error}]"
 
-    return error_message
+def error_message_detail(error: object, error_detail: types.ModuleType) -> str:
+    _,_,exc_tb = error_detail.exc_info() # gives out which file the exception has occured, on which line number
+    return _format_error_message(error, exc_tb)
 
 class CustomException(Exception): # this inheritance will allow this class to behave like normal exceptions (you can raise and catch it), but with extra functionality that we can define
-    def __init__(self, error_message, error_detail):
+    _error: object
+    _tb: Optional[types.TracebackType]
+
+    def __init__(self, error_message: object, error_detail: types.ModuleType) -> None:
         super().__init__(error_message) # inherits the __init__() function from the parent class Exception
         # Ensures the base Exception properly stores the message so Python's exception system can still use it (e.g., printing the exception).
-        self.error_message = error_message_detail(error_message, error_detail)
+        # Only the traceback is captured here; the message is built lazily, when the exception is actually rendered.
+        self._error = error_message
+        self._tb = error_detail.exc_info()[2]
+
+    @property
+    def error_message(self) -> str:
+        return _format_error_message(self._error, self._tb)
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.error_message
     
 # if __name__ == "__main__":
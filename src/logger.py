@@ -14,22 +14,34 @@ In a machine learning project, logging is especially useful because it helps:
 - Keep a record of experiments and results for reproducibility.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 LOG_FILE = f"{datetime.now().strftime('%m_%d_%Y_%H_%M_%S')}.log"
-logs_path = os.path.join(os.getcwd(), "logs", LOG_FILE)
-os.makedirs(logs_path, exist_ok = True)
+logs_dir = os.path.join(os.getcwd(), "logs")
+os.makedirs(logs_dir, exist_ok = True) # one shared directory, not a new directory per log file
 
-LOG_FILE_PATH = os.path.join(logs_path, LOG_FILE)
-
-logging.basicConfig(
-    filename=LOG_FILE_PATH,
-    format="[ %(asctime)s ] %(lineno)d %(name)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
+LOG_FILE_PATH = os.path.join(logs_dir, LOG_FILE)
 
+# The file handler (and its formatter, built once) lives on a background listener thread.
+# Logging calls only put the record on a queue, so the pipeline never blocks on disk writes.
+file_handler = logging.FileHandler(LOG_FILE_PATH)
+file_handler.setFormatter(
+    logging.Formatter("[ %(asctime)s ] %(lineno)d %(name)s - %(levelname)s - %(message)s")
 )
 
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+listener = logging.handlers.QueueListener(log_queue, file_handler)
+listener.start()
+atexit.register(listener.stop) # flush the queued records before the interpreter exits
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
 # if __name__ == "__main__":
 #     logging.info("Logging has started") # runs only when the file is run directly, not when it is imported
\ No newline at end of file
@@ -1,12 +1,21 @@
 import os
 import sys
+import pickle
+import struct
 import dill
-import numpy as np
-import pandas as pd
+import joblib
 
 from src.exception import CustomException
 
-def save_object(file_path, obj): # target path and object to serialize
+# Errors raised by pickle/joblib for objects they can't serialize (lambdas, local classes, ...).
+PICKLING_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+# Out-of-band file layout: magic, header (buffer count, pickle stream length, one byte length per
+# buffer, all little-endian uint64), the pickle stream, then the raw buffers back to back.
+OOB_MAGIC = b"MLPROJ-OOB1\n"
+OOB_UINT = struct.Struct("<Q")
+
+def save_object(file_path, obj, buffers=None): # target path, object to serialize and optional out-of-band buffer list
     try:
         # compute the directory path of the target path (empty if only filename provided).
         dir_path = os.path.dirname(file_path)
@@ -14,10 +23,75 @@ def save_object(file_path, obj): # target path and object to serialize
         # Ensure the directory exists so the file write won't fail.
         os.makedirs(dir_path, exist_ok=True)
 
-        # Open the target path in binary write mode and serialize the object with dill.
+        if buffers is None:
+            # joblib writes NumPy arrays from their own buffers and LZ4-compresses the stream,
+            # which is much faster than the disk and shrinks the low-entropy fitted arrays.
+            try:
+                joblib.dump(obj, file_path, compress=("lz4", 3), protocol=5)
+                return
+            except PICKLING_ERRORS:
+                pass # fall back to dill below
+
+        # Open the target path in binary write mode and serialize the object with pickle protocol 5.
         with open(file_path, "wb") as file_obj:
-            dill.dump(obj, file_obj)
+            if buffers is not None:
+                # NumPy arrays are not copied into the pickle stream: their buffers are collected in
+                # `buffers` and written raw after the (small) stream. Reload with load_object.
+                try:
+                    stream = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+                except PICKLING_ERRORS:
+                    buffers.clear() # drop buffers collected by the failed pickle attempt
+                else:
+                    raw_buffers = [buffer.raw() for buffer in buffers] # flat byte memoryviews, no copy
+                    file_obj.write(OOB_MAGIC)
+                    file_obj.write(OOB_UINT.pack(len(raw_buffers)))
+                    file_obj.write(OOB_UINT.pack(len(stream)))
+                    for raw in raw_buffers:
+                        file_obj.write(OOB_UINT.pack(raw.nbytes))
+                    file_obj.write(stream)
+                    for raw in raw_buffers:
+                        file_obj.write(raw)
+                    return
+
+            # Fall back to dill for objects plain pickle can't handle.
+            dill.dump(obj, file_obj, protocol=5)
     
     except Exception as e:
         # Standardize error handling with project-specific exception wrapper.
-        raise CustomException(e, sys)
\ No newline at end of file
+        raise CustomException(e, sys)
+
+def _load_out_of_band(file_obj):
+    # Reads the layout written by save_object(..., buffers=[...]); file_obj is positioned after OOB_MAGIC.
+    def read_uint():
+        return OOB_UINT.unpack(file_obj.read(OOB_UINT.size))[0]
+
+    n_buffers = read_uint()
+    stream_length = read_uint()
+    buffer_lengths = [read_uint() for _ in range(n_buffers)]
+    stream = file_obj.read(stream_length)
+
+    buffers = []
+    for length in buffer_lengths:
+        buffer = bytearray(length) # writable, so the rebuilt NumPy arrays are writable too
+        if file_obj.readinto(buffer) != length:
+            raise EOFError("Out-of-band buffer is truncated")
+        buffers.append(pickle.PickleBuffer(buffer))
+
+    return pickle.loads(stream, buffers=buffers)
+
+def load_object(file_path): # path of an object written by save_object
+    try:
+        with open(file_path, "rb") as file_obj:
+            if file_obj.read(len(OOB_MAGIC)) == OOB_MAGIC:
+                return _load_out_of_band(file_obj)
+
+        try:
+            # joblib also reads plain (uncompressed) pickles
+            return joblib.load(file_path)
+        except Exception:
+            # dill fallback artifacts may reference objects only dill can rebuild
+            with open(file_path, "rb") as file_obj:
+                return dill.load(file_obj)
+
+    except Exception as e:
+        raise CustomException(e, sys)
@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.components.data_transformation import DataTransformation, DataTransformationConfig
+
+STUD_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "notebook", "data", "stud.csv")
+
+
+@pytest.fixture
+def missing_categoricals_csv(tmp_path):
+    """
+    Train CSV where row 0 has blank gender and lunch cells, and the last row is a copy of row 0
+    with those cells filled with the column modes. Once imputed, both rows must transform the same.
+    """
+    df = pd.read_csv(STUD_CSV).head(200)
+    filled = df.iloc[[0]].copy()
+    df.loc[0, ["gender", "lunch"]] = np.nan
+    filled["gender"] = df["gender"].mode()[0]
+    filled["lunch"] = df["lunch"].mode()[0]
+    df = pd.concat([df, filled], ignore_index=True)
+
+    path = tmp_path / "train.csv"
+    df.to_csv(path, index=False)  # missing values are written as blank cells
+    return str(path)
+
+
+@pytest.fixture
+def transformation(tmp_path):
+    config = DataTransformationConfig(
+        preprocessor_obj_file_path=str(tmp_path / "preprocessor.pkl"),
+        streaming_preprocessor_obj_file_path=str(tmp_path / "streaming_preprocessor.pkl"),
+        train_arr_file_path=str(tmp_path / "train_arr.dat"),
+        test_arr_file_path=str(tmp_path / "test_arr.dat"),
+    )
+    return DataTransformation(config)
+
+
+@pytest.fixture
+def quantized_transformation(tmp_path):
+    config = DataTransformationConfig(
+        streaming_preprocessor_obj_file_path=str(tmp_path / "q_streaming_preprocessor.pkl"),
+        train_arr_file_path=str(tmp_path / "q_train_arr.dat"),
+        test_arr_file_path=str(tmp_path / "q_test_arr.dat"),
+        quantize_num_features=True,
+        train_num_arr_file_path=str(tmp_path / "q_train_num_arr.dat"),
+        test_num_arr_file_path=str(tmp_path / "q_test_num_arr.dat"),
+    )
+    return DataTransformation(config)
+
+
+def _dense(arr):
+    return arr.toarray() if hasattr(arr, "toarray") else np.asarray(arr)
+
+
+def test_blank_categoricals_are_imputed(transformation, missing_categoricals_csv):
+    train_arr, _, _ = transformation.initiate_data_transformation(missing_categoricals_csv, missing_categoricals_csv)
+    train_arr = _dense(train_arr)
+
+    np.testing.assert_allclose(train_arr[0], train_arr[-1])
+
+
+def test_blank_categoricals_are_imputed_streaming(transformation, missing_categoricals_csv):
+    train_arr, _, _ = transformation.initiate_streaming_data_transformation(
+        missing_categoricals_csv, missing_categoricals_csv, chunksize=64
+    )
+
+    np.testing.assert_allclose(train_arr[0], train_arr[-1])
+
+
+def test_streaming_quantized_numerical_columns(transformation, quantized_transformation):
+    train_arr, _, _ = transformation.initiate_streaming_data_transformation(STUD_CSV, STUD_CSV, chunksize=300)
+    (num_arr, rest_arr), _, _ = quantized_transformation.initiate_streaming_data_transformation(
+        STUD_CSV, STUD_CSV, chunksize=300
+    )
+
+    scale = quantized_transformation.data_transformation_config.num_quantization_scale
+    n_num = num_arr.shape[1]
+    assert num_arr.dtype == np.int16
+    # Values beyond the int16 range saturate instead of wrapping around
+    info = np.iinfo(np.int16)
+    expected = np.clip(train_arr[:, :n_num], info.min / scale, info.max / scale)
+    np.testing.assert_allclose(num_arr / scale, expected, atol=0.5 / scale + 1e-6)
+    np.testing.assert_array_equal(rest_arr, train_arr[:, n_num:])